@@ -1,9 +1,15 @@
 from s2reader.common.tools import read_xml
 
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Tuple, Union, Optional
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import re
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from lxml import etree
+
+# Band name and resolution from an IMG_DATA file stem (e.g. '..._B02_10m')
+_IMG_RE = re.compile(r'_([A-Z0-9]{2,3})_(\d{2})m')
 
 class Metadata:
     """Sentinel-2 Level 2A Metadata Reader.
@@ -12,6 +18,18 @@ class Metadata:
     It extracts information about bands, wavelengths, and other metadata from XML files.
     """
 
+    __slots__ = ('product', 'tile', 'bands', '_band_lookup', 'images', '_offsets', '_quant')
+
+    # Precompiled XPath expressions, evaluated by libxml2
+    _XP_SPEC = etree.XPath(".//Spectral_Information")
+    _XP_IMAGE_FILE = etree.XPath(".//Granule/IMAGE_FILE")
+
+    # Band types carrying a quantification value
+    _QUANT_TYPES = ('WVP', 'AOT', 'BOA')
+
+    # Band table columns indexed for dict lookups
+    _BAND_KEYS = ('band_tag', 'band_id', 'band_phys')
+
     def __init__(self, product_path: Path) -> None:
         """
         Initialize the Metadata instance.
@@ -19,10 +37,15 @@ class Metadata:
         Args:
             product_path (Path): Path to the .SAFE directory containing Sentinel-2 metadata.
         """
-        # Load the product and tile metadata files, and generate the band table
+        # Load the product and tile metadata files, and generate the band and image tables
         self.product = self._read_product_metadata(product_path)
         self.tile = self._read_tile_metadata(product_path)
         self.bands = self._create_band_table()
+        self._band_lookup = self._index_band_table()
+        self.images = self._index_images(product_path)
+
+        # Index offsets and quantification values once, so per-band lookups are dict hits
+        self._offsets, self._quant = self._index_values()
 
     def get_band_offset(self, band_tag: str) -> float:
         """
@@ -35,10 +58,9 @@ class Metadata:
             float: The offset value for the specified band.
         """
         target = self._refer_band(band_tag, 'band_tag', 'band_id')
-        band_offset = self.product.find(f".//BOA_ADD_OFFSET[@band_id='{target}']")
-        if band_offset is None:
+        if target not in self._offsets:
             raise KeyError(f"No offset found for band {band_tag}")
-        return float(band_offset.text)
+        return self._offsets[target]
 
     def get_band_quantification(self, band_type: str) -> float:
         """
@@ -50,29 +72,48 @@ class Metadata:
         Returns:
             float: Band quantification value for DN to reflectance conversion.
         """
-        if band_type not in ['WVP', 'AOT', 'BOA']:
+        if band_type not in self._QUANT_TYPES:
             raise ValueError(f"No quantification value for type {band_type}")
-        quantification_value = self.product.find(f".//{band_type}_QUANTIFICATION_VALUE")
-        if quantification_value is None:
+        if band_type not in self._quant:
             raise KeyError(f"Quantification value not found for band type {band_type}")
-        return float(quantification_value.text)
+        return self._quant[band_type]
 
-    def _extract_band_info(self, band: ET.Element) -> Dict[str, Union[str, int, float, List[float]]]:
+    def _index_values(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Collect the BOA offsets and quantification values in a single pass over the product metadata.
+
+        Returns:
+            Tuple[Dict[str, float], Dict[str, float]]: Offset values keyed by band ID, and
+                quantification values keyed by band type (e.g., 'BOA').
+        """
+        quant_tags = {f"{band_type}_QUANTIFICATION_VALUE": band_type for band_type in self._QUANT_TYPES}
+        offsets: Dict[str, float] = {}
+        quant: Dict[str, float] = {}
+
+        for elem in self.product.iter('BOA_ADD_OFFSET', *quant_tags):
+            if elem.tag == 'BOA_ADD_OFFSET':
+                offsets.setdefault(elem.attrib['band_id'], float(elem.text))
+            else:
+                quant.setdefault(quant_tags[elem.tag], float(elem.text))
+
+        return offsets, quant
+
+    def _extract_band_info(self, band: etree._Element) -> Dict[str, Union[str, int, float, np.ndarray]]:
         """
         Extract band information from an XML element.
 
         Args:
-            band (ET.Element): XML element containing band information.
+            band (etree._Element): XML element containing band information.
 
         Returns:
-            Dict[str, Union[str, int, float, List[float]]]: A dictionary with band information.
+            Dict[str, Union[str, int, float, np.ndarray]]: A dictionary with band information.
         """
         band_id = band.attrib["bandId"]
         physical_band = band.attrib["physicalBand"]
         band_tag = self._phys_to_tag(physical_band)
         resolution = int(band.find("RESOLUTION").text)
         wavelengths = self._parse_wavelengths(band)
-        spectral_values = list(map(float, band.find("Spectral_Response/VALUES").text.split()))
+        spectral_values = np.asarray(band.find("Spectral_Response/VALUES").text.split(), dtype=np.float32)
 
         return {
             "band_id": band_id,
@@ -83,12 +124,12 @@ class Metadata:
             "rsr": spectral_values
         }
 
-    def _parse_wavelengths(self, band: ET.Element) -> Dict[str, float]:
+    def _parse_wavelengths(self, band: etree._Element) -> Dict[str, float]:
         """
         Parse wavelength information from an XML element.
 
         Args:
-            band (ET.Element): XML element containing wavelength information.
+            band (etree._Element): XML element containing wavelength information.
 
         Returns:
             Dict[str, float]: A dictionary with min, max, and central wavelengths.
@@ -106,10 +147,42 @@ class Metadata:
         Returns:
             pd.DataFrame: A DataFrame containing band information.
         """
-        data = [self._extract_band_info(band) for band in self.product.findall(".//Spectral_Information")]
+        data = [self._extract_band_info(band) for band in self._XP_SPEC(self.product)]
         return pd.DataFrame(data)
 
-    def _read_product_metadata(self, path: Path) -> ET.ElementTree:
+    def _index_band_table(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Index the rows of the band table by each of its identifier columns.
+
+        Returns:
+            Dict[str, Dict[str, Dict]]: Band rows, keyed by column name then identifier value.
+        """
+        return {column: self.bands.set_index(column, drop=False).to_dict('index') for column in self._BAND_KEYS}
+
+    def _index_images(self, path: Path) -> Dict[str, List[Tuple[int, Path]]]:
+        """
+        Index the granule image files listed in the product metadata by band name.
+
+        Args:
+            path (Path): Path to the .SAFE directory.
+
+        Returns:
+            Dict[str, List[Tuple[int, Path]]]: (resolution, JP2 path) pairs keyed by band name (e.g., 'B02').
+        """
+        images: Dict[str, List[Tuple[int, Path]]] = {}
+
+        for image_file in self._XP_IMAGE_FILE(self.product):
+            image_path = path / image_file.text
+            match = _IMG_RE.search(image_path.stem)
+            if not match:
+                continue
+
+            name, resolution = match.groups()
+            images.setdefault(name, []).append((int(resolution), image_path.with_suffix('.jp2')))
+
+        return images
+
+    def _read_product_metadata(self, path: Path) -> etree._ElementTree:
         """
         Read the MTD_MSIL2A.xml file from the product directory.
 
@@ -117,14 +190,14 @@ class Metadata:
             path (Path): Path to the .SAFE directory.
 
         Returns:
-            ET.ElementTree: Parsed XML data.
+            etree._ElementTree: Parsed XML data.
         """
         product_meta_path = path / 'MTD_MSIL2A.xml'
         if not product_meta_path.exists():
             raise FileNotFoundError(f"Product metadata file not found: {product_meta_path}")
         return read_xml(product_meta_path)
 
-    def _read_tile_metadata(self, path: Path) -> ET.ElementTree:
+    def _read_tile_metadata(self, path: Path) -> etree._ElementTree:
         """
         Read the MTD_TL.xml file from the GRANULE directory.
 
@@ -132,14 +205,16 @@ class Metadata:
             path (Path): Path to the .SAFE directory.
 
         Returns:
-            ET.ElementTree: Parsed XML data.
+            etree._ElementTree: Parsed XML data.
         """
         results = list(path.glob('GRANULE/*/MTD_TL.xml'))
         if len(results) != 1:
             raise ValueError(f"Expected a single MTD_TL.xml file, found {len(results)}")
         return read_xml(results[0])
 
-    def _tag_to_phys(self, band_tag: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _tag_to_phys(band_tag: str) -> str:
         """
         Convert band tag notation to physical band notation.
 
@@ -151,7 +226,9 @@ class Metadata:
         """
         return 'B' + band_tag.replace('B', '').lstrip('0')
 
-    def _phys_to_tag(self, band_phys: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _phys_to_tag(band_phys: str) -> str:
         """
         Convert physical band notation to band tag notation.
 
@@ -173,10 +250,10 @@ class Metadata:
         Returns:
             str: Physical band notation (e.g., 'B8').
         """
-        band = self.bands[self.bands['band_id'] == band_id]
-        if band.empty:
+        band = self._band_lookup['band_id'].get(band_id)
+        if band is None:
             raise KeyError(f"No band found with ID {band_id}")
-        return band['band_phys'].iloc[0]
+        return band['band_phys']
 
     def _refer_band(self, band_ref: str, search_column: str, return_column: str) -> str:
         """
@@ -190,6 +267,12 @@ class Metadata:
         Returns:
             str: The corresponding value from the return column.
         """
+        if search_column in self._band_lookup:
+            band_info = self._band_lookup[search_column].get(band_ref)
+            if band_info is None:
+                raise KeyError(f"No match found for {band_ref} in column {search_column}")
+            return band_info[return_column]
+
         band_info = self.bands[self.bands[search_column] == band_ref]
         if band_info.empty:
             raise KeyError(f"No match found for {band_ref} in column {search_column}")
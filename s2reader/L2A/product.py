@@ -1,29 +1,91 @@
+from s2reader.common.tools import match_values
 from s2reader.L2A.metadata import Metadata
 from s2reader.L2A.readers import ReflectanceReader, ClassificationReader, AtmosphericReader
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Union
 from pathlib import Path
+import os
 import re
+import numpy as np
+import rasterio
 import xarray as xr
 import pandas as pd
 
+try:
+    from numcodecs import Blosc
+except ImportError:  # Optional, only needed for Zarr caching
+    Blosc = None
+
+def _tag_dispatch(readers: List[type]) -> Dict[str, type]:
+    """
+    Maps each literal tag to the reader handling it, ensuring no tag is claimed by multiple readers.
+
+    Args:
+        readers (List[type]): Reader classes, each defining `_PATTERNS`.
+
+    Returns:
+        Dict[str, type]: Reader class keyed by literal tag.
+
+    Raises:
+        ValueError: If duplicate tags are found across readers.
+    """
+    tag_to_readers: Dict[str, List[type]] = {}
+
+    for reader in readers:
+        for tag in reader._PATTERNS:
+            tag_to_readers.setdefault(tag, []).append(reader)
+
+    # Identify duplicates
+    duplicates = {tag: matches for tag, matches in tag_to_readers.items() if len(matches) > 1}
+
+    if duplicates:
+        duplicate_messages = [f"Tag '{tag}' is used by {', '.join(reader.__module__ for reader in matches)}"
+                              for tag, matches in duplicates.items()]
+        raise ValueError("Duplicate tags found:\n" + "\n".join(duplicate_messages))
+
+    return {tag: matches[0] for tag, matches in tag_to_readers.items() if tag in matches[0]._LITERALS}
+
 class L2AProduct:
     """Sentinel-2 Level 2A Product Reader
 
     Interface for reading Sentinel-2 Level 2A products (.SAFE format).
     Provides methods to read, update, and manage raster and vector data.
+
+    Bands are stored as separate variables of an `xr.Dataset` (`ds`), each keeping its own
+    dtype and chunking; `da` stacks them along a `band` dimension on access.
     """
 
+    __slots__ = ('safe_path', 'target_resolution', 'chunks', 'meta', '_img_paths',
+                 '_ds', '_pending', 'mask', '_gdf', '_pending_vec', '_mask', '_masked_bands',
+                 '_zarr_path')
+
     _READERS: List[type] = [
         ReflectanceReader, 
         ClassificationReader, 
         AtmosphericReader
     ]
 
+    # Reader for each tag, checked for duplicates once at import
+    _TAG_DISPATCH: Dict[str, type] = _tag_dispatch(_READERS)
+
+    # Zarr chunk size (pixels) along each spatial dimension, and variable holding the mask
+    _ZARR_CHUNK: int = 1024
+    _ZARR_MASK: str = '_mask'
+
+    # GDAL configuration for reads: multi-threaded JP2 decoding and a larger block cache (MB)
+    _GDAL_OPTIONS: Dict[str, Union[str, int]] = {
+        'GDAL_NUM_THREADS': 'ALL_CPUS',
+        'GDAL_CACHEMAX': 512,
+        'CPL_VSIL_CURL_ALLOWED_EXTENSIONS': '.jp2',
+    }
+
     def __init__(self, 
                  safe_path: str, 
                  target_resolution: Optional[int] = None, 
-                 mask: Optional[Dict[str, List[float]]] = None) -> None:
+                 mask: Optional[Dict[str, List[float]]] = None,
+                 chunks: Optional[Dict[str, int]] = None,
+                 resolve: bool = False) -> None:
         """
         Initializes an L2AProduct instance.
 
@@ -31,89 +93,253 @@ class L2AProduct:
             safe_path (Optional[str]): Path to the .SAFE directory containing Sentinel-2 data.
             target_resolution (Optional[int]): Desired resolution (default is 10 meters).
             mask (Dict[str, List[int]]): Dictionary of band names and their corresponding mask values.
+            chunks (Optional[Dict[str, int]]): Dask chunk sizes for band data (e.g. {'x': 2048, 'y': 2048}).
+                Requires dask. Defaults to None, reading bands eagerly into numpy arrays.
+            resolve (bool): Resolve symlinks in `safe_path`, which stats each parent directory.
+                Defaults to False, only making the path absolute, unless it must be resolved
+                to find the .SAFE directory name.
         """
         # Parse args
-        self.safe_path = Path(safe_path).resolve()
-        self.target_resolution = 10 if target_resolution is None else target_resolution
+        safe_path = Path(safe_path)
+        safe_path = safe_path.resolve() if resolve else safe_path.absolute()
 
-        # Ensure is .SAFE
-        if self.safe_path.suffixes != ['.SAFE']:
-            raise Exception(f'{self.safe_path} is not a .SAFE directory')
+        # Ensure is .SAFE, resolving paths such as '..' or a symlink to the product if needed
+        if not safe_path.name.endswith('.SAFE'):
+            safe_path = safe_path.resolve()
+            if not safe_path.name.endswith('.SAFE'):
+                raise Exception(f'{safe_path} is not a .SAFE directory')
+
+        self.safe_path = safe_path
+        self.target_resolution = 10 if target_resolution is None else target_resolution
+        self.chunks = chunks
 
         # Load metadata
         self.meta = Metadata(self.safe_path)
+        self._img_paths = self._index_img_paths()
 
-        # Initialize empty DataArray and GeoDataFrame
-        self.da: Optional[xr.DataArray] = None
+        # Initialize empty Dataset and GeoDataFrame, plus buffers of data
+        # awaiting a single merge or concatenation
+        self._ds: Optional[xr.Dataset] = None
+        self._pending: List[xr.DataArray] = []
         self.mask: Optional[xr.DataArray] = None
-        self.gdf: Optional[pd.DataFrame] = None
+        self._gdf: Optional[pd.DataFrame] = None
+        self._pending_vec: List[pd.DataFrame] = []
 
-        # Ensure multiple readers do not have similar tags
-        self._unique_tags()
+        # Mask, and the bands it has already been applied to
+        self._mask: Optional[xr.DataArray] = None
+        self._masked_bands: set = set()
+
+        # Zarr store the bands were restored from, and may still be lazily read from
+        self._zarr_path: Optional[Path] = None
 
         # Generate mask
         if mask is not None:
             for band, values in mask.items():
                 self._add_mask(band, values)
 
+    @property
+    def ds(self) -> Optional[xr.Dataset]:
+        """
+        Raster data with one variable per band, merging any pending bands in a single pass.
+
+        Returns:
+            Optional[xr.Dataset]: The Dataset of all bands read so far, or None.
+        """
+        if self._pending:
+            datasets = [da.to_dataset(dim='band') for da in self._pending]
+            if self._ds is not None:
+                datasets.insert(0, self._ds)
+            # Bands are checked to share the grid when added, so skip coordinate alignment
+            self._ds = xr.merge(datasets, join='override', compat='override', combine_attrs='drop_conflicts')
+            self._pending = []
+        return self._ds
+
+    @ds.setter
+    def ds(self, value: Optional[xr.Dataset]) -> None:
+        self._pending = []
+        self._ds = value
+
+    @property
+    def da(self) -> Optional[xr.DataArray]:
+        """
+        Raster data stacked along a `band` dimension, in the order the bands were read.
+
+        The stack is a copy built on each access, promoting all bands to a common dtype, so
+        keep a reference rather than accessing it repeatedly, or use `ds` for per-band access.
+        It is made read-only, so edits go through `ds`, or by assigning a new DataArray to `da`.
+
+        Returns:
+            Optional[xr.DataArray]: The DataArray of all bands read so far, or None.
+        """
+        ds = self.ds
+        if ds is None:
+            return None
+
+        stacked = ds.to_dataarray(dim='band')
+        # Writes to the copy would not reach the Dataset, so refuse them
+        if isinstance(stacked.data, np.ndarray):
+            stacked.data.flags.writeable = False
+        return stacked
+
+    @da.setter
+    def da(self, value: Optional[xr.DataArray]) -> None:
+        self.ds = None if value is None else value.to_dataset(dim='band')
+
+    @property
+    def gdf(self) -> Optional[pd.DataFrame]:
+        """
+        Vector data, with any pending frames concatenated in a single pass.
+
+        Returns:
+            Optional[pd.DataFrame]: The vector data read so far, or None.
+        """
+        if self._pending_vec:
+            frames = self._pending_vec if self._gdf is None else [self._gdf, *self._pending_vec]
+            self._gdf = pd.concat(frames)
+            self._pending_vec = []
+        return self._gdf
+
+    @gdf.setter
+    def gdf(self, value: Optional[pd.DataFrame]) -> None:
+        self._pending_vec = []
+        self._gdf = value
+
     def read(self, *tags: str) -> None:
         """
         Reads specified data tags using the appropriate readers.
 
+        Tags are read concurrently in a thread pool, as JP2 decoding and warping release
+        the GIL. Results are added in the order the tags were given. The pool size defaults
+        to the CPU count, and can be capped with the S2READER_MAX_WORKERS environment variable.
+
+        Each read runs within a `rasterio.Env` configured from `_GDAL_OPTIONS`. Options set as
+        environment variables, or in a `rasterio.Env` wrapping the call, take precedence. For
+        chunked products, bands decoded by dask when computed run outside of that environment,
+        so set the options as environment variables for them to apply there.
+
         Args:
             *tags (str): List of data tags to read.
 
         Raises:
+            KeyError: If no reader handles one of the tags.
+            ValueError: If a band is not on the grid of the product. The other bands are still added.
             Exception: If a reader returns an unsupported data type.
         """
-        for tag in tags:
-            for reader in self._READERS:
-                if tag not in reader._PATTERNS:
-                    continue
-
-                if self._exists(tag):
-                    continue
-
-                data = reader(self).read(tag)
-
+        # Pair each tag not yet read with its reader
+        jobs = []
+        errors = []
+        for tag in dict.fromkeys(tags):
+            if self._exists(tag):
+                continue
+
+            # Literal tags dispatch directly, otherwise fall back to regex patterns
+            reader = self._TAG_DISPATCH.get(tag)
+            if reader is None:
+                reader = next((r for r in self._READERS if r.compatible(tag)), None)
+            if reader is None:
+                raise KeyError(f"No reader found for tag '{tag}'")
+
+            jobs.append((reader, tag))
+
+        if jobs:
+            gdal_options = self._gdal_options()
+            max_workers = int(os.environ.get('S2READER_MAX_WORKERS', 0)) or os.cpu_count() or 1
+            with ThreadPoolExecutor(max_workers=min(len(jobs), max_workers)) as executor:
+                results = list(executor.map(lambda job: self._read_one(*job, gdal_options), jobs))
+
+            # Update serially, so no locking is needed
+            for (reader, tag), data in zip(jobs, results):
                 if isinstance(data, xr.DataArray):
-                    self.update(da=data)
-                elif isinstance(data, pd.DataFrame):
-                    self.update(vec=data)
+                    try:
+                        self.update(da=data)
+                    except ValueError as e:
+                        # Leave out the offending band only
+                        errors.append(str(e))
+                        continue
                 else:
-                    raise Exception(f'Reader {reader.__module__} returned data type {type(data)}, expected xarray.DataArray or pandas.DataFrame')
+                    self.update(vec=data)
+
+                if reader._MASKS_ON_READ and self._mask is not None:
+                    self._masked_bands.add(tag)
 
         self._apply_mask()
 
+        if errors:
+            raise ValueError("\n".join(errors))
+
+    def _read_one(self, reader: type, tag: str, gdal_options: Dict[str, Union[str, int]]) -> Union[xr.DataArray, pd.DataFrame]:
+        """
+        Reads a single tag, without modifying the product.
+
+        Args:
+            reader (type): Reader class handling the tag.
+            tag (str): The data tag to read.
+            gdal_options (Dict[str, Union[str, int]]): GDAL configuration options to read with.
+
+        Returns:
+            Union[xr.DataArray, pd.DataFrame]: The data returned by the reader.
+
+        Raises:
+            Exception: If the reader returns an unsupported data type.
+        """
+        # rasterio environments are thread-local, so each worker enters its own
+        with rasterio.Env(**gdal_options):
+            data = reader(self).read(tag)
+
+        if not isinstance(data, (xr.DataArray, pd.DataFrame)):
+            raise Exception(f'Reader {reader.__module__} returned data type {type(data)}, expected xarray.DataArray or pandas.DataFrame')
+
+        return data
+
+    def _gdal_options(self) -> Dict[str, Union[str, int]]:
+        """
+        Resolves the GDAL configuration options for reads.
+
+        Defaults from `_GDAL_OPTIONS` are skipped when set as environment variables, and options
+        of a `rasterio.Env` active in the calling thread override them.
+
+        Returns:
+            Dict[str, Union[str, int]]: GDAL configuration options.
+        """
+        options = {key: value for key, value in self._GDAL_OPTIONS.items() if key not in os.environ}
+        if rasterio.env.hasenv():
+            options.update(rasterio.env.getenv())
+        return options
+
     def remove(self, *tags: str) -> None:
         """
-        Remove specified bands from the DataArray.
+        Remove specified bands from the Dataset.
 
         Args:
             *tags (str): List of band names to remove.
         """
-        if self.da is None or 'band' not in self.da.dims:
+        if self.ds is None:
             raise ValueError("No bands available to remove.")
 
         # Filter out the bands that need to be removed
-        remaining_bands = self.da.band.isin(tags)
-        if remaining_bands.sum() == len(self.da.band):
-            # If all bands are removed, set self.da to None
-            self.da = None
+        removed = [band for band in dict.fromkeys(tags) if band in self.ds.data_vars]
+        self._masked_bands -= set(removed)
+        remaining = self.ds.drop_vars(removed)
+        if not remaining.data_vars:
+            # If all bands are removed, set self.ds to None
+            self.ds = None
         else:
             # Keep only the bands that are not in the tags
-            self.da = self.da.sel(band=~remaining_bands)
+            self.ds = remaining
 
     def update(self, vec: Optional[pd.DataFrame] = None, da: Optional[xr.DataArray] = None) -> None:
         """
-        Adds bands to the DataArray or vector data to the GeoDataFrame.
+        Adds bands to the Dataset or vector data to the GeoDataFrame.
+
+        Data is buffered and merged once, on the next access of `ds`/`da` or `gdf`.
 
         Args:
             vec (Optional[pd.DataFrame]): Vector data (e.g., footprints, masks). Defaults to None.
-            da (Optional[xr.DataArray]): DataArray containing raster data. Defaults to None.
+            da (Optional[xr.DataArray]): DataArray containing raster data, with a `band` dimension. Defaults to None.
 
         Raises:
             Exception: If no data is provided or both `vec` and `da` are provided.
+            ValueError: If `da` is not on the grid of the bands already added.
         """
         if (vec is None) and (da is None):
             raise Exception('No data to add')
@@ -121,19 +347,136 @@ class L2AProduct:
         if (vec is not None) and (da is not None):
             raise Exception('Can only add one type of data at a time')
 
-        # Add the band data to the DataArray
+        # Queue the band data for the Dataset
         if da is not None:
-            if self.da is None:
-                self.da = da
-            else:
-                self.da = xr.concat([self.da, da], dim='band')
+            self._check_grid(da)
+            self._pending.append(da)
 
-        # Add the vector data to the GeoDataFrame
+        # Queue the vector data for the GeoDataFrame
         if vec is not None:
-            if self.gdf is None:
-                self.gdf = vec
-            else:
-                self.gdf = pd.concat([self.gdf, vec])
+            self._pending_vec.append(vec)
+
+    def to_zarr(self, store_path: str, chunks: Optional[Dict[str, int]] = None) -> None:
+        """
+        Writes the decoded bands to a Zarr store, so later sessions can skip JP2 decoding.
+
+        Each band is written as a Blosc (zstd) compressed variable, along with the product path,
+        target resolution, band order, bands already masked and the mask itself, so `from_zarr`
+        can restore the product.
+
+        Args:
+            store_path (str): Path of the Zarr store, overwritten if it exists. Bands restored
+                from the same store are loaded into memory first.
+            chunks (Optional[Dict[str, int]]): Zarr chunk sizes for the spatial dimensions.
+                Defaults to `_ZARR_CHUNK` pixels along both.
+
+        Raises:
+            ValueError: If no bands have been read.
+            ImportError: If zarr is not installed.
+        """
+        if self.ds is None:
+            raise ValueError("No bands available to write.")
+        if Blosc is None:
+            raise ImportError("Writing to Zarr requires zarr, install with `pip install .[zarr]`")
+
+        # Restored bands are read lazily from their store, which mode='w' clears before writing
+        if self._zarr_path is not None and self._zarr_path == Path(store_path).resolve():
+            self.ds = self.ds.load()
+            self._zarr_path = None
+
+        ds = self.ds.assign_attrs(
+            safe_path=str(self.safe_path),
+            target_resolution=self.target_resolution,
+            band_order=list(self.ds.data_vars),
+            masked_bands=sorted(self._masked_bands),
+        )
+
+        # Masked bands no longer hold the masked values, so the mask is stored as is
+        if self._mask is not None:
+            ds = ds.assign({self._ZARR_MASK: self._mask})
+
+        # Chunk each band on the spatial grid, clipped to the band shape, with dimensions
+        # not given unchunked
+        chunks = {dim: self._ZARR_CHUNK for dim in ('y', 'x')} if chunks is None else chunks
+        sizes = {dim: min(chunks.get(dim, size), size) for dim, size in ds.sizes.items()}
+        compressor = Blosc(cname='zstd', clevel=3, shuffle=Blosc.SHUFFLE)
+        encoding = {
+            band: {'compressor': compressor, 'chunks': tuple(sizes[dim] for dim in ds[band].dims)}
+            for band in ds.data_vars
+        }
+
+        # Dask chunks must line up with the Zarr chunks
+        if any(ds[band].chunks is not None for band in ds.data_vars):
+            ds = ds.chunk(sizes)
+
+        ds.to_zarr(store_path, mode='w', encoding=encoding)
+
+    @classmethod
+    def from_zarr(cls,
+                  store_path: str,
+                  chunks: Optional[Dict[str, int]] = None) -> 'L2AProduct':
+        """
+        Restores a product from a Zarr store written by `to_zarr`, without decoding the stored bands.
+
+        The product metadata is read from the original .SAFE directory, which must still exist.
+        The stored mask is restored, and applied to bands read later from their JP2 files as usual.
+
+        Args:
+            store_path (str): Path of the Zarr store.
+            chunks (Optional[Dict[str, int]]): Dask chunk sizes for band data. Requires dask.
+                Defaults to None, lazily loading bands into numpy arrays.
+
+        Returns:
+            L2AProduct: The restored product.
+        """
+        ds = xr.open_zarr(store_path, chunks=chunks)
+
+        product = cls(ds.attrs['safe_path'], target_resolution=ds.attrs['target_resolution'], chunks=chunks)
+
+        # Restore the mask in memory, as it is updated in place
+        if cls._ZARR_MASK in ds.data_vars:
+            product._mask = ds[cls._ZARR_MASK].load()
+            product._masked_bands.update(ds.attrs.get('masked_bands', []))
+
+        # Variables are listed alphabetically by the store, so restore the read order
+        product.ds = ds[ds.attrs.get('band_order', [band for band in ds.data_vars if band != cls._ZARR_MASK])]
+        product._zarr_path = Path(store_path).resolve()
+
+        return product
+
+    def _check_grid(self, da: xr.DataArray) -> None:
+        """
+        Ensures a band shares the spatial grid of the bands already added, so they can be merged
+        without alignment.
+
+        Args:
+            da (xr.DataArray): Band data to be added.
+
+        Raises:
+            ValueError: If the x or y coordinates differ from those of the bands already added.
+        """
+        reference = self._ds if self._ds is not None else next(iter(self._pending), None)
+        if reference is None:
+            return
+
+        for dim in ('y', 'x'):
+            if not reference.indexes[dim].equals(da.indexes[dim]):
+                raise ValueError(f"Bands {da.band.values.tolist()} are not on the grid of the product "
+                                 f"(differing '{dim}' coordinates)")
+
+    def _index_img_paths(self) -> Dict[str, Path]:
+        """
+        Selects, for each band, the image file with the resolution closest to the target resolution.
+
+        Ties are broken towards the finer resolution.
+
+        Returns:
+            Dict[str, Path]: Path to the JP2 file keyed by band name (e.g., 'B02').
+        """
+        return {
+            name: min(entries, key=lambda entry: (abs(entry[0] - self.target_resolution), entry[0]))[1]
+            for name, entries in self.meta.images.items()
+        }
 
     def _add_mask(self, tag: str, values: List[float]) -> None:
         """
@@ -143,33 +486,50 @@ class L2AProduct:
             tag (str): The band name to mask.
             values (List[float]): List of values to mask.
         """
-        # Read and select the relevant DataArray
+        # Read and select the relevant band
         self.read(tag)
-        arr = self.da.sel(band=tag).drop('band')
-
-        # Ensure _mask exists and is initialized to False
-        if not hasattr(self, "_mask") or self._mask is None:
-            self._mask = xr.zeros_like(arr, dtype=bool)
+        arr = self.ds[tag]
 
         # Create a boolean mask for the given values
-        mask = xr.zeros_like(arr, dtype=bool)
-        for value in values:
-            mask = mask | (arr == value)
+        mask = match_values(arr.values, values)
 
-        # Update the master mask
-        self._mask |= mask
+        # Nothing to mask (e.g. a cloud-free tile), leave the master mask unchanged
+        if not mask.any():
+            return
+
+        # Update the master mask in place, which bands masked so far do not reflect
+        if self._mask is None:
+            self._mask = arr.copy(data=mask)
+        else:
+            np.logical_or(self._mask.data, mask, out=self._mask.data)
+        self._masked_bands.clear()
 
     def _apply_mask(self) -> None:
         """
-        Applies the mask to the DataArray, if it exists.
+        Applies the mask to the bands of the Dataset, if it exists, skipping bands already masked.
+
+        Bands masked here are recorded, so subsequent reads only mask newly added bands.
+
+        The mask only exists once a masked value has been found, so all-False masks cost nothing.
+        Only the unmasked variables are touched; the rest of the Dataset is not copied.
         """
-        if hasattr(self, "_mask") and self._mask is not None:
-            self.da = self.da.where(~self._mask)
+        if self._mask is None or self.ds is None:
+            return
+
+        unmasked = [band for band in self.ds.data_vars if band not in self._masked_bands]
+        if not unmasked:
+            return
+
+        self.ds = self.ds.assign({band: self.ds[band].where(~self._mask) for band in unmasked})
+        self._masked_bands.update(unmasked)
 
     def _is_compatible(self, tag: str, patterns: List[Union[str, re.Pattern]]) -> bool:
         """
         Checks if a given tag matches any string or regex pattern in the provided list.
 
+        Plain strings are matched by equality; only compiled patterns and strings containing
+        regex syntax go through the regex engine.
+
         Args:
             tag (str): The tag to check.
             patterns (List[Union[str, re.Pattern]]): List of valid tag patterns (string or regex).
@@ -177,14 +537,20 @@ class L2AProduct:
         Returns:
             bool: True if the tag matches a pattern, otherwise False.
         """
+        if tag in patterns:
+            return True
+
         for pattern in patterns:
-            if tag == pattern or re.fullmatch(pattern, tag):
+            if isinstance(pattern, re.Pattern):
+                if pattern.fullmatch(tag):
+                    return True
+            elif re.escape(pattern) != pattern and re.fullmatch(pattern, tag):
                 return True
         return False
 
     def _exists(self, tag: str) -> bool:
         """
-        Checks if a given tag exists in the DataArray.
+        Checks if a given tag exists in the Dataset, or is pending merge.
 
         Args:
             tag (str): The tag to check.
@@ -192,27 +558,6 @@ class L2AProduct:
         Returns:
             bool: True if the tag exists, otherwise False.
         """
-        return self.da is not None and tag in self.da.band.values
-
-    def _unique_tags(self) -> None:
-        """
-        Checks for duplicate tags across different readers and raises an error if found.
-
-        Raises:
-            ValueError: If duplicate tags are found across readers.
-        """
-        tag_to_readers: Dict[str, List[str]] = {}
-
-        for reader in self._READERS:
-            for tag in reader._PATTERNS:
-                if tag in tag_to_readers:
-                    tag_to_readers[tag].append(reader.__module__)
-                else:
-                    tag_to_readers[tag] = [reader.__module__]
-
-        # Identify duplicates
-        duplicates = {tag: readers for tag, readers in tag_to_readers.items() if len(readers) > 1}
-
-        if duplicates:
-            duplicate_messages = [f"Tag '{tag}' is used by {', '.join(readers)}" for tag, readers in duplicates.items()]
-            raise ValueError("Duplicate tags found:\n" + "\n".join(duplicate_messages))
\ No newline at end of file
+        if any(tag in da.band.values for da in self._pending):
+            return True
+        return self._ds is not None and tag in self._ds.data_vars
\ No newline at end of file
@@ -1,5 +1,6 @@
 from s2reader.L2A.readers.jp2.img.img import IMGReader
 import xarray as xr
+from rasterio.enums import Resampling
 
 class AtmosphericReader(IMGReader):
     """
@@ -10,6 +11,8 @@ class AtmosphericReader(IMGReader):
     """
 
     _PATTERNS = ['WVP', 'AOT']
+    _MASKS_ON_READ = True
+    _RESAMPLING = Resampling.average  # Continuous values are averaged when downsampling
 
     def read(self, tag: str) -> xr.DataArray:
         """
@@ -17,6 +20,7 @@ class AtmosphericReader(IMGReader):
 
         This method locates the JP2 file for the specified band tag, reads the data,
         applies the quantification value, and returns the processed data.
+        If the product has a mask, it is applied within the same pass.
 
         Args:
             tag (str): The band tag (e.g., 'WVP' or 'AOT') to read and process.
@@ -35,8 +39,8 @@ class AtmosphericReader(IMGReader):
         # Retrieve the quantification value from metadata
         quant = self.product.meta.get_band_quantification(tag)
 
-        # Apply the quantification value
-        band_data = band_data / quant
+        # Apply the quantification value, as a single multiply
+        band_data = self._rescale(band_data, 1.0 / quant)
 
         # Return the processed atmospheric data
         return band_data
@@ -1,5 +1,6 @@
 from s2reader.L2A.readers.jp2.img.img import IMGReader
 import xarray as xr
+from rasterio.enums import Resampling
 
 class ClassificationReader(IMGReader):
     """
@@ -10,6 +11,7 @@ class ClassificationReader(IMGReader):
     """
 
     _PATTERNS = ['SCL']
+    _RESAMPLING = Resampling.nearest  # Categorical classes must not be interpolated
 
     def read(self, tag: str) -> xr.DataArray:
         """
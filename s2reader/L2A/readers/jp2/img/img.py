@@ -1,10 +1,53 @@
 from s2reader.L2A.readers.jp2.jp2 import JP2Reader
 
-import re
-import pandas as pd
+import numpy as np
+import xarray as xr
 from pathlib import Path
 from typing import Optional
 
+try:
+    import numexpr as ne
+except ImportError:  # Optional, multithreaded scaling falls back to numpy
+    ne = None
+
+try:
+    import dask.array as dsa
+except ImportError:  # Optional, only needed for chunked products
+    dsa = None
+
+
+def _scale_offset(arr: np.ndarray, scale: float, bias: float, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Apply an affine transform to raw digital numbers in a single pass, optionally masking the output.
+
+    Uses numexpr, multithreaded across cores, when it is installed.
+
+    Args:
+        arr (np.ndarray): Raw digital numbers.
+        scale (float): Multiplicative factor.
+        bias (float): Additive term, applied after scaling.
+        mask (Optional[np.ndarray]): Boolean mask broadcastable to arr, True where the output is set to NaN.
+
+    Returns:
+        np.ndarray: The transformed float32 array.
+    """
+    out = np.empty(arr.shape, dtype=np.float32)
+
+    if ne is not None:
+        local_dict = {'x': arr, 's': np.float32(scale), 'b': np.float32(bias)}
+        if mask is None:
+            ne.evaluate('x * s + b', local_dict=local_dict, out=out, casting='unsafe')
+        else:
+            local_dict.update(m=np.broadcast_to(mask, arr.shape), nan=np.float32(np.nan))
+            ne.evaluate('where(m, nan, x * s + b)', local_dict=local_dict, out=out, casting='unsafe')
+        return out
+
+    np.multiply(arr, np.float32(scale), out=out)
+    out += np.float32(bias)
+    if mask is not None:
+        np.copyto(out, np.nan, where=mask)
+    return out
+
 
 class IMGReader(JP2Reader):
     """
@@ -18,36 +61,51 @@ class IMGReader(JP2Reader):
         """
         Finds the best image file path for a given band tag and target resolution.
 
+        The file with the resolution closest to the target is used, so as little resampling
+        as possible is needed. Paths are resolved once per product.
+
         Args:
             tag (str): The band tag (e.g., 'B08') to locate the corresponding image file.
 
         Returns:
             Optional[Path]: Path to the best available image file, or None if no match is found.
         """
-        # Extract image file paths from metadata
-        image_files = self.product.meta.product.findall('.//Granule/IMAGE_FILE')
-        if not image_files:
+        # Image file paths, indexed once from the metadata
+        if not self.product.meta.images:
             raise ValueError("No image files found in metadata.")
 
-        image_list = []
+        return self.product._img_paths.get(tag)
 
-        for image_file in image_files:
-            image_path = self.product.safe_path / image_file.text
-            match = re.search(r'_([A-Z0-9]{2,3})_(\d{2})m', image_path.stem)
-            if not match:
-                continue
+    def _rescale(self, band_data: xr.DataArray, scale: float, bias: float = 0.0) -> xr.DataArray:
+        """
+        Convert raw digital numbers to physical values as `DN * scale + bias`, in a single pass.
 
-            name, resolution = match.groups()
-            if name == tag:
-                image_list.append((name, int(resolution), image_path.with_suffix('.jp2')))
+        If the product has a mask, it is applied within the same pass. Dask-backed data stays
+        lazy, with the conversion and mask fused into one task per chunk.
 
-        if not image_list:
-            return None
+        Args:
+            band_data (xr.DataArray): Raw band data.
+            scale (float): Multiplicative factor.
+            bias (float): Additive term, applied after scaling. Defaults to 0.
 
-        # Convert to DataFrame
-        image_df = pd.DataFrame(image_list, columns=['name', 'resolution', 'path'])
+        Returns:
+            xr.DataArray: The converted float32 band data.
+        """
+        mask = self.product._mask
+        arr = band_data.data
+        fused = mask is not None and mask.shape == arr.shape[-2:]
+        mask_arr = mask.values if fused else None
+        if isinstance(arr, np.ndarray):
+            arr = _scale_offset(arr, scale, bias, mask_arr)
+        else:
+            # Dask-backed, fuse per chunk, with the mask chunked alike
+            if fused:
+                mask_arr = dsa.from_array(mask_arr, chunks=arr.chunks[-2:])[np.newaxis]
+            arr = arr.map_blocks(_scale_offset, scale, bias, mask_arr, dtype=np.float32)
+        band_data = xr.DataArray(arr, coords=band_data.coords, dims=band_data.dims)
 
-        # Find the best path based on the minimum resolution difference
-        best_path = image_df.loc[image_df['resolution'].idxmin()]['path']
+        # Mask with alignment when it could not be fused
+        if mask is not None and not fused:
+            band_data = band_data.where(~mask)
 
-        return best_path
\ No newline at end of file
+        return band_data
\ No newline at end of file
@@ -1,6 +1,7 @@
 from s2reader.L2A.readers.jp2.img.img import IMGReader
 
 import xarray as xr
+from rasterio.enums import Resampling
 
 class ReflectanceReader(IMGReader):
     """
@@ -11,6 +12,8 @@ class ReflectanceReader(IMGReader):
     """
 
     _PATTERNS = ['B01', 'B02', 'B03', 'B04', 'B05', 'B06', 'B07', 'B08', 'B8A', 'B09', 'B10', 'B11', 'B12']
+    _MASKS_ON_READ = True
+    _RESAMPLING = Resampling.average  # Continuous values are averaged when downsampling
 
     def read(self, tag: str) -> xr.DataArray:
         """
@@ -18,6 +21,7 @@ class ReflectanceReader(IMGReader):
 
         This method locates the JP2 file for the specified band tag, reads the data,
         applies the band offset and quantification value, and returns the processed data.
+        If the product has a mask, it is applied within the same pass.
 
         Args:
             tag (str): The band tag (e.g., 'B08') to read and process.
@@ -37,9 +41,9 @@ class ReflectanceReader(IMGReader):
         offset = self.product.meta.get_band_offset(tag)
         quant = self.product.meta.get_band_quantification('BOA')
 
-        # Apply offset and quantification to the band data
-        band_data = band_data + offset
-        band_data = band_data / quant
+        # Apply offset and quantification to the band data, folding
+        # (DN + offset) / quant into a single multiply-add
+        band_data = self._rescale(band_data, 1.0 / quant, offset / quant)
 
         # Return the processed reflectance data
         return band_data
@@ -1,8 +1,13 @@
 from s2reader.L2A.readers.reader import BaseReader
 
+import numpy as np
+import rasterio
 import rioxarray as rio
 import xarray as xr
 from pathlib import Path
+from rasterio.enums import Resampling
+from rasterio.transform import Affine, from_origin
+from rasterio.vrt import WarpedVRT
 
 class JP2Reader(BaseReader):
     """
@@ -12,10 +17,21 @@ class JP2Reader(BaseReader):
     and return the data as an xarray DataArray.
     """
 
+    _RESAMPLING: Resampling = Resampling.nearest  # Resampling method used when warping to the target resolution
+
     def read_jp2(self, tag: str, path: Path) -> xr.DataArray:
         """
         Read a JP2 file and resample it to the target resolution.
 
+        Files already at the target resolution are returned as read. Files downsampled by an
+        integer factor are read decimated, letting the JP2 driver decode only the resolution
+        level needed, provided both dimensions divide evenly so the grid lines up with warped
+        bands. Otherwise the file is opened through a WarpedVRT, so decoding and
+        resampling happen in a single GDAL call. If the product defines `chunks`, the data
+        is returned dask-backed, and decoded when computed, in dask's threads and outside the
+        calling GDAL environment. Otherwise it is decoded before returning, so the decode runs
+        in the calling thread and GDAL environment.
+
         Args:
             tag (str): The band tag (e.g., 'B08') to associate with the data.
             path (Path): Path to the JP2 file to be read.
@@ -26,19 +42,89 @@ class JP2Reader(BaseReader):
         if not path.exists():
             raise FileNotFoundError(f"JP2 file not found: {path}")
 
-        # Read in the band data
+        target = self.product.target_resolution
+        chunks = self.product.chunks
+
+        # Read in the band data, without locking so dask can read chunks concurrently
         try:
-            band_data = rio.open_rasterio(path)
+            band_data = rio.open_rasterio(path, chunks=chunks, lock=False)
+
+            # Resample to the target resolution, unless already there
+            x_res, y_res = band_data.rio.resolution()
+            if (abs(x_res), abs(y_res)) != (target, target):
+                factor = target / abs(x_res)
+                if (abs(x_res) == abs(y_res) and factor > 1 and factor.is_integer()
+                        and band_data.rio.width % factor == 0 and band_data.rio.height % factor == 0):
+                    band_data = self._read_decimated(path, int(factor))
+                else:
+                    band_data = self._read_warped(path, target)
+                if chunks is not None:
+                    band_data = band_data.chunk(chunks)
+
+            # Decode now, rather than lazily on first access
+            if chunks is None:
+                band_data = band_data.load()
         except Exception as e:
             raise ValueError(f"Failed to read JP2 file at {path}: {e}")
 
-        # Resample to the target resolution
-        band_data = band_data.rio.reproject(
-            band_data.rio.crs,  # Keep the same CRS
-            resolution=self.product.target_resolution,
-        )
-
         # Add the band name as a coordinate
         band_data = band_data.assign_coords(band=[tag])
 
-        return band_data
\ No newline at end of file
+        return band_data
+
+    def _read_decimated(self, path: Path, factor: int) -> xr.DataArray:
+        """
+        Read a JP2 file downsampled by an integer factor, without a warp pass.
+
+        Args:
+            path (Path): Path to the JP2 file to be read.
+            factor (int): Downsampling factor for both axes, dividing both dimensions evenly.
+
+        Returns:
+            xr.DataArray: The downsampled band data.
+        """
+        with rasterio.open(path) as src:
+            height, width = src.height // factor, src.width // factor
+            data = src.read(out_shape=(src.count, height, width), resampling=self._RESAMPLING)
+            transform = src.transform * Affine.scale(factor)
+            crs, nodata = src.crs, src.nodata
+
+        # Pixel centre coordinates, as rioxarray would produce them
+        x = transform.c + (np.arange(width) + 0.5) * transform.a
+        y = transform.f + (np.arange(height) + 0.5) * transform.e
+
+        band_data = xr.DataArray(
+            data,
+            coords={'band': np.arange(1, data.shape[0] + 1), 'y': y, 'x': x},
+            dims=('band', 'y', 'x'),
+        )
+        band_data = band_data.rio.write_crs(crs).rio.write_transform(transform)
+        if nodata is not None:
+            band_data = band_data.rio.write_nodata(nodata)
+
+        return band_data
+
+    def _read_warped(self, path: Path, resolution: int) -> xr.DataArray:
+        """
+        Read a JP2 file resampled on the fly to the given resolution.
+
+        Args:
+            path (Path): Path to the JP2 file to be read.
+            resolution (int): Output pixel size, in CRS units.
+
+        Returns:
+            xr.DataArray: The resampled band data.
+        """
+        with rasterio.open(path) as src:
+            # Keep the same CRS and origin, covering the same bounds
+            left, bottom, right, top = src.bounds
+            transform = from_origin(left, top, resolution, resolution)
+            width = round((right - left) / resolution)
+            height = round((top - bottom) / resolution)
+
+            # Warp with all cores
+            warp_extras = {'NUM_THREADS': 'ALL_CPUS'}
+
+            with WarpedVRT(src, crs=src.crs, transform=transform, width=width, height=height,
+                           resampling=self._RESAMPLING, **warp_extras) as vrt:
+                return rio.open_rasterio(vrt).load()
\ No newline at end of file
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import re
-from typing import List, Any
+from typing import List, Any, FrozenSet, Optional
 
 class BaseReader(ABC):
     """Abstract base class for file readers.
@@ -11,6 +11,21 @@ class BaseReader(ABC):
     """
 
     _PATTERNS: List[str] = []  # List of regex patterns for file matching
+    _LITERALS: FrozenSet[str] = frozenset()  # Patterns without regex syntax, matched by equality
+    _REGEX: Optional[re.Pattern] = None  # Remaining patterns, compiled into a single alternation
+    _MASKS_ON_READ: bool = False  # Whether read() already applies the product mask
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Split the subclass `_PATTERNS` into literal tags and a single compiled regex.
+        """
+        super().__init_subclass__(**kwargs)
+
+        literals = [p for p in cls._PATTERNS if isinstance(p, str) and re.escape(p) == p]
+        regexes = [p.pattern if isinstance(p, re.Pattern) else p for p in cls._PATTERNS if p not in literals]
+
+        cls._LITERALS = frozenset(literals)
+        cls._REGEX = re.compile('|'.join(f'(?:{p})' for p in regexes)) if regexes else None
 
     def __init__(self, product: object) -> None:
         """
@@ -21,7 +36,8 @@ class BaseReader(ABC):
         """
         self.product = product  # Reference to the L2AProduct instance
 
-    def compatible(self, tag: str) -> bool:
+    @classmethod
+    def compatible(cls, tag: str) -> bool:
         """
         Check if a given tag matches any of the patterns defined in `_PATTERNS`.
 
@@ -31,10 +47,9 @@ class BaseReader(ABC):
         Returns:
             bool: True if the tag matches a pattern, otherwise False.
         """
-        for pattern in self._PATTERNS:
-            if tag == pattern or re.fullmatch(pattern, tag):
-                return True
-        return False
+        if tag in cls._LITERALS:
+            return True
+        return cls._REGEX is not None and cls._REGEX.fullmatch(tag) is not None
 
     @abstractmethod
     def read(self, tag: str) -> Any:
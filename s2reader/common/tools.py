@@ -1,15 +1,44 @@
-import xml.etree.ElementTree as ET
+from lxml import etree
 from pathlib import Path
+from typing import Sequence
+import numpy as np
 
-def read_xml(xml_path:Path) -> ET.ElementTree:
+def read_xml(xml_path:Path) -> etree._ElementTree:
     """ Read an XML file and return the parsed data
 
+    Whitespace-only text nodes and comments (a large share of the indented MTD files)
+    are dropped while parsing, and no ID table is built.
+
     Args:
         xml_path (Path): Filepath to the XML file
 
     Returns:
-        ET.ElementTree: Parsed XML data
+        etree._ElementTree: Parsed XML data
     """
     
-    tree = ET.parse(str(xml_path))
-    return tree
\ No newline at end of file
+    parser = etree.XMLParser(remove_blank_text=True, remove_comments=True, collect_ids=False)
+    tree = etree.parse(str(xml_path), parser)
+    return tree
+
+def match_values(arr:np.ndarray, values:Sequence[float]) -> np.ndarray:
+    """ Flag the elements of an array equal to any of the given values, in a single pass
+
+    Small unsigned integer arrays (e.g. the uint8 SCL) are matched with a lookup table
+    gather, others with np.isin.
+
+    Args:
+        arr (np.ndarray): Array to match
+        values (Sequence[float]): Values to flag
+
+    Returns:
+        np.ndarray: Boolean array of the same shape as arr
+    """
+
+    if arr.dtype.kind == 'u' and arr.dtype.itemsize <= 2:
+        lut = np.zeros(np.iinfo(arr.dtype).max + 1, dtype=bool)
+        values = np.asarray(values, dtype=np.float64)
+        # Only whole values within the dtype range can ever match
+        values = values[(values == np.round(values)) & (values >= 0) & (values < lut.size)]
+        lut[values.astype(np.intp)] = True
+        return lut[arr]
+    return np.isin(arr, values)
\ No newline at end of file
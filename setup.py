@@ -12,7 +12,13 @@ setup(
         'rioxarray==0.16.0',
         'xarray==2024.6.0',
         'scipy==1.14.0',
+        'lxml==5.2.2',
     ],
+    extras_require={
+        'fast': ['numexpr==2.10.1'],  # Multithreaded DN scaling
+        'dask': ['dask==2024.6.2'],  # Chunked, lazy band reads
+        'zarr': ['zarr==2.18.2'],  # Caching decoded bands with L2AProduct.to_zarr
+    },
     python_requires='==3.11.9',  # Specify the minimum Python version
     #entry_points={},
 )
\ No newline at end of file
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+TILE = 'T51PUP'
+SIZE = 30                 # Pixels per side, at 20 m
+BANDS = {'0': 'B1', '1': 'B2', '2': 'B3', '7': 'B8'}
+
+# Band name and file resolution (m) of each image
+IMAGES = {'B02': 20, 'B03': 20, 'SCL': 20, 'B08': 10, 'B01': 60}
+
+
+def _write_image(path, data, resolution):
+    height, width = data.shape
+    profile = dict(driver='GTiff', width=width, height=height, count=1, dtype=data.dtype,
+                   crs='EPSG:32651', transform=from_origin(300000, 1600020, resolution, resolution))
+    with rasterio.open(path, 'w', **profile) as dst:
+        dst.write(data, 1)
+
+
+@pytest.fixture
+def safe(tmp_path):
+    """Synthetic .SAFE product with B02, B03 and SCL at 20 m, B08 at 10 m and B01 at 60 m."""
+    safe_path = tmp_path / f'S2A_MSIL2A_20230926T022331_N0509_R103_{TILE}_20230926T062553.SAFE'
+    granule = safe_path / 'GRANULE' / f'L2A_{TILE}'
+    granule.mkdir(parents=True)
+    (granule / 'MTD_TL.xml').write_text('<Level-2A_Tile_ID/>')
+
+    rng = np.random.default_rng(0)
+    image_files = []
+    for name, resolution in IMAGES.items():
+        size = SIZE * 20 // resolution
+        if name == 'SCL':
+            data = rng.integers(0, 12, (size, size), dtype=np.uint8)
+        else:
+            data = rng.integers(1000, 5000, (size, size), dtype=np.uint16)
+
+        img_dir = granule / 'IMG_DATA' / f'R{resolution}m'
+        img_dir.mkdir(parents=True, exist_ok=True)
+        stem = f'{TILE}_20230926T022331_{name}_{resolution}m'
+        _write_image(img_dir / f'{stem}.jp2', data, resolution)
+        image_files.append(f'<IMAGE_FILE>GRANULE/L2A_{TILE}/IMG_DATA/R{resolution}m/{stem}</IMAGE_FILE>')
+
+    spectral = ''.join(
+        f'<Spectral_Information bandId="{band_id}" physicalBand="{phys}"><RESOLUTION>10</RESOLUTION>'
+        '<Wavelength><MIN>400</MIN><MAX>600</MAX><CENTRAL>500</CENTRAL></Wavelength>'
+        '<Spectral_Response><STEP>1</STEP><VALUES>0.1 0.5 1.0 0.5 0.1</VALUES></Spectral_Response>'
+        '</Spectral_Information>'
+        for band_id, phys in BANDS.items()
+    )
+    offsets = ''.join(f'<BOA_ADD_OFFSET band_id="{band_id}">-1000</BOA_ADD_OFFSET>' for band_id in BANDS)
+    (safe_path / 'MTD_MSIL2A.xml').write_text(
+        '<Level-2A_User_Product><General_Info><Product_Info><Product_Organisation>'
+        f'<Granule_List><Granule>{"".join(image_files)}</Granule></Granule_List>'
+        '</Product_Organisation></Product_Info><Product_Image_Characteristics>'
+        '<QUANTIFICATION_VALUES_LIST><BOA_QUANTIFICATION_VALUE>10000</BOA_QUANTIFICATION_VALUE>'
+        '<AOT_QUANTIFICATION_VALUE>1000</AOT_QUANTIFICATION_VALUE>'
+        '<WVP_QUANTIFICATION_VALUE>1000</WVP_QUANTIFICATION_VALUE></QUANTIFICATION_VALUES_LIST>'
+        f'<BOA_ADD_OFFSET_VALUES_LIST>{offsets}</BOA_ADD_OFFSET_VALUES_LIST>'
+        f'<Spectral_Information_List>{spectral}</Spectral_Information_List>'
+        '</Product_Image_Characteristics></General_Info></Level-2A_User_Product>'
+    )
+    return safe_path
@@ -0,0 +1,19 @@
+from s2reader import L2AProduct
+
+
+def test_decimated_and_warped_bands_share_grid(safe):
+    # B02 is read as is, B08 decimated from 10 m and B01 warped from 60 m
+    indexes = {}
+    for tag in ('B02', 'B08', 'B01'):
+        product = L2AProduct(safe, target_resolution=20)
+        product.read(tag)
+        indexes[tag] = product.ds.indexes
+
+    for tag in ('B08', 'B01'):
+        for dim in ('y', 'x'):
+            assert indexes[tag][dim].equals(indexes['B02'][dim])
+
+    # And merge without a grid mismatch
+    product = L2AProduct(safe, target_resolution=20)
+    product.read('B02', 'B08', 'B01')
+    assert list(product.ds.data_vars) == ['B02', 'B08', 'B01']